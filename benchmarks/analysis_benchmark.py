@@ -0,0 +1,41 @@
+"""Compara o custo das métricas com o custo de uma STFT.
+
+Uso:
+    python -m benchmarks.analysis_benchmark
+"""
+
+import timeit
+
+import numpy as np
+
+from src.audio import analysis
+from src.utils.config import SAMPLE_RATE, DURATION, DEFAULT_FREQUENCY
+
+REPEAT = 5
+NUMBER = 50
+
+
+def best_time(fn):
+    """Menor tempo médio por chamada (ms) entre as repetições."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e3
+
+
+def main():
+    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
+    signals = {
+        'senoidal': np.sin(2 * np.pi * DEFAULT_FREQUENCY * t),
+        'ruído': np.random.default_rng(0).standard_normal(len(t)),
+    }
+
+    print(f"{'sinal':<10}{'STFT (ms)':>12}{'métricas (ms)':>16}{'razão':>8}")
+    for name, signal_data in signals.items():
+        spectrogram = analysis.compute_spectrogram(signal_data, SAMPLE_RATE)
+        stft_ms = best_time(lambda: analysis.compute_spectrogram(signal_data, SAMPLE_RATE))
+        metrics_ms = best_time(lambda: analysis.analyze_signal(
+            signal_data, SAMPLE_RATE, DEFAULT_FREQUENCY, spectrogram=spectrogram
+        ))
+        print(f"{name:<10}{stft_ms:>12.3f}{metrics_ms:>16.3f}{metrics_ms / stft_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
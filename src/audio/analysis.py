@@ -0,0 +1,138 @@
+"""Extração de métricas de áudio a partir dos quadros da STFT."""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+from ..utils.config import (
+    SPECTROGRAM_NPERSEG, SPECTROGRAM_NOVERLAP, ROLLOFF_PERCENT, THD_MAX_HARMONIC
+)
+
+EPS = 1e-12
+THD_BIN_HALF_WIDTH = 2  # bins somados em torno de cada harmônico (vazamento da janela)
+
+
+def spectrogram_params(n_samples):
+    """Retorna (nperseg, noverlap) ajustados ao tamanho do sinal."""
+    nperseg = min(SPECTROGRAM_NPERSEG, n_samples)
+    noverlap = min(SPECTROGRAM_NOVERLAP, nperseg // 2)
+    return nperseg, noverlap
+
+
+def compute_spectrogram(signal_data, sample_rate):
+    """Calcula o espectrograma de potência usado na visualização e nas métricas."""
+    nperseg, noverlap = spectrogram_params(len(signal_data))
+    return signal.spectrogram(
+        signal_data,
+        fs=sample_rate,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        window='hann',  # baixo vazamento: evita THD falsa em senoides puras
+        scaling='spectrum'
+    )
+
+
+def frame_signal(signal_data, nperseg, noverlap):
+    """Divide o sinal nos mesmos quadros da STFT (view, sem cópia)."""
+    return sliding_window_view(signal_data, nperseg)[::nperseg - noverlap]
+
+
+def _safe_divide(num, den):
+    """Divisão elemento a elemento que retorna 0 onde o denominador é nulo."""
+    return np.divide(num, den, out=np.zeros(np.shape(num)), where=den > EPS)
+
+
+def compute_frame_metrics(signal_data, spectrogram):
+    """Calcula as métricas por quadro sobre os quadros do espectrograma.
+
+    Todas as operações são vetorizadas sobre a matriz (frequência x tempo)
+    já produzida por `compute_spectrogram`, sem uma segunda STFT.
+    """
+    f, _, Sxx = spectrogram
+    nperseg, noverlap = spectrogram_params(len(signal_data))
+    frames = frame_signal(signal_data, nperseg, noverlap)[:Sxx.shape[1]]
+
+    # Domínio do tempo: RMS, pico e fator de crista
+    rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / nperseg)
+    peak = np.maximum(frames.max(axis=1), -frames.min(axis=1))
+    crest = _safe_divide(peak, rms)
+
+    # Domínio da frequência: cópia contígua (quadro x frequência) para que
+    # as reduções percorram a memória em sequência
+    power = np.ascontiguousarray(Sxx.T)
+    total = power.sum(axis=1)
+    centroid = _safe_divide(power @ f, total)
+    cumulative = np.cumsum(power, axis=1)
+    rolloff_idx = np.argmax(cumulative >= ROLLOFF_PERCENT * total[:, None], axis=1)
+    rolloff = np.where(total > EPS, f[rolloff_idx], 0.0)
+    # Reaproveita o buffer da soma acumulada para o log (evita outra alocação)
+    log_power = np.log(np.add(power, EPS, out=cumulative), out=cumulative)
+    log_mean = log_power.mean(axis=1)
+    flatness = _safe_divide(np.exp(log_mean), total / power.shape[1])
+
+    return {
+        'rms': rms,
+        'peak': peak,
+        'crest_factor': crest,
+        'spectral_centroid': centroid,
+        'spectral_rolloff': rolloff,
+        'spectral_flatness': flatness
+    }
+
+
+def estimate_thd(spectrogram, fundamental):
+    """Estima a distorção harmônica total (razão) a partir do espectro médio.
+
+    Retorna NaN quando a resolução da STFT não separa os harmônicos ou
+    quando a fundamental está fora da faixa analisável.
+    """
+    f, _, Sxx = spectrogram
+    df = f[1] - f[0]
+    width = 2 * THD_BIN_HALF_WIDTH + 1
+    if fundamental < width * df:
+        return float('nan')
+
+    power = Sxx.mean(axis=1)
+    harmonics = np.arange(1, THD_MAX_HARMONIC + 1) * fundamental
+    harmonics = harmonics[harmonics < f[-1] - THD_BIN_HALF_WIDTH * df]
+    if harmonics.size == 0:
+        return float('nan')
+    centers = np.rint(harmonics / df).astype(int)
+    bins = centers[:, None] + np.arange(-THD_BIN_HALF_WIDTH, THD_BIN_HALF_WIDTH + 1)
+    harmonic_power = power[bins].sum(axis=1)
+
+    if harmonic_power[0] <= EPS:
+        return float('nan')
+    return float(np.sqrt(harmonic_power[1:].sum() / harmonic_power[0]))
+
+
+def summarize(signal_data, frame_metrics, thd=float('nan')):
+    """Agrega as métricas por quadro em valores únicos para o sinal."""
+    rms = float(np.sqrt(np.dot(signal_data, signal_data) / max(len(signal_data), 1)))
+    peak = float(max(signal_data.max(), -signal_data.min())) if len(signal_data) else 0.0
+    return {
+        'rms': rms,
+        'peak': peak,
+        'crest_factor': peak / rms if rms > EPS else 0.0,
+        'spectral_centroid': float(np.mean(frame_metrics['spectral_centroid'])),
+        'spectral_rolloff': float(np.mean(frame_metrics['spectral_rolloff'])),
+        'spectral_flatness': float(np.mean(frame_metrics['spectral_flatness'])),
+        'thd': thd
+    }
+
+
+def analyze_signal(signal_data, sample_rate, fundamental=None, spectrogram=None):
+    """Calcula espectrograma, métricas por quadro e resumo de um sinal.
+
+    Se `spectrogram` for fornecido, ele é reutilizado. `fundamental` (Hz)
+    habilita a estimativa de THD, válida para o gerador senoidal.
+    """
+    if spectrogram is None:
+        spectrogram = compute_spectrogram(signal_data, sample_rate)
+    frames = compute_frame_metrics(signal_data, spectrogram)
+    thd = estimate_thd(spectrogram, fundamental) if fundamental else float('nan')
+    return {
+        'spectrogram': spectrogram,
+        'frames': frames,
+        'summary': summarize(signal_data, frames, thd)
+    }
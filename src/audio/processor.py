@@ -1,13 +1,13 @@
 """Processamento de áudio e efeitos."""
 
 import numpy as np
-from scipy import signal
 from scipy.fft import fft, fftfreq
 import soundfile as sf
 import sounddevice as sd
 from pedalboard import Pedalboard
 
 from ..utils.config import SAMPLE_RATE, DURATION
+from . import analysis
 
 class AudioProcessor:
     def __init__(self):
@@ -15,11 +15,37 @@ class AudioProcessor:
         self.duration = DURATION
         self.t = np.linspace(0, self.duration, int(self.sample_rate * self.duration))
         self.board = Pedalboard([])
+        self._versions = {'original': 0, 'processed': 0}
+        self._fundamentals = {'original': None, 'processed': None}
+        self._analysis_cache = {}
         self.reset_signals()
 
+    @property
+    def test_signal(self):
+        """Sinal original; cada atribuição invalida o cache de métricas."""
+        return self._test_signal
+
+    @test_signal.setter
+    def test_signal(self, value):
+        self._test_signal = value
+        self._versions['original'] += 1
+        self._fundamentals['original'] = self.frequency if self.signal_source == 'sine' else None
+
+    @property
+    def processed_signal(self):
+        """Sinal processado; cada atribuição invalida o cache de métricas."""
+        return self._processed_signal
+
+    @processed_signal.setter
+    def processed_signal(self, value):
+        self._processed_signal = value
+        self._versions['processed'] += 1
+        self._fundamentals['processed'] = self._fundamentals['original']
+
     def reset_signals(self):
         """Reinicia os sinais para o estado inicial."""
         self.frequency = 440
+        self.signal_source = 'sine'
         self.test_signal = np.sin(2 * np.pi * self.frequency * self.t)
         self.processed_signal = self.test_signal.copy()
 
@@ -35,6 +61,7 @@ class AudioProcessor:
         audio_data = audio_data / np.max(np.abs(audio_data))
         
         # Ajustar tamanho
+        self.signal_source = 'file'
         target_length = int(self.sample_rate * self.duration)
         if len(audio_data) > target_length:
             self.test_signal = audio_data[:target_length]
@@ -44,6 +71,7 @@ class AudioProcessor:
     def update_sine_wave(self, frequency):
         """Atualiza o sinal senoidal com nova frequência."""
         self.frequency = frequency
+        self.signal_source = 'sine'
         self.test_signal = np.sin(2 * np.pi * self.frequency * self.t)
 
     def compute_spectrum(self, signal_data):
@@ -55,13 +83,33 @@ class AudioProcessor:
 
     def compute_spectrogram(self, signal_data):
         """Calcula o espectrograma do sinal."""
-        return signal.spectrogram(
-            signal_data,
-            fs=self.sample_rate,
-            nperseg=1024,
-            noverlap=512,
-            scaling='spectrum'
+        return analysis.compute_spectrogram(signal_data, self.sample_rate)
+
+    def process(self, effects_manager):
+        """Aplica os efeitos ao sinal original e atualiza o sinal processado."""
+        self.processed_signal = effects_manager.process_audio(self.test_signal, self.sample_rate)
+        return self.processed_signal
+
+    def analyze(self, which='processed'):
+        """Retorna espectrograma e métricas do sinal 'original' ou 'processed'.
+
+        O resultado é armazenado em cache por versão do sinal: só é recalculado
+        quando o sinal correspondente é substituído. A fundamental usada na THD
+        é a do sinal original no momento da atribuição. 'processed' reflete o
+        último sinal atribuído; após mudar o sinal original, chame `process`
+        antes de analisá-lo.
+        """
+        version = self._versions[which]
+        cached = self._analysis_cache.get(which)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        signal_data = self.test_signal if which == 'original' else self.processed_signal
+        result = analysis.analyze_signal(
+            signal_data, self.sample_rate, self._fundamentals[which]
         )
+        self._analysis_cache[which] = (version, result)
+        return result
 
     def play(self, signal_data):
         """Reproduz o áudio."""
@@ -1,5 +1,6 @@
 """Interface principal do aplicativo."""
 
+import math
 import tkinter as tk
 from tkinter import ttk, filedialog
 
@@ -53,6 +54,9 @@ class MainWindow:
         # Seção de controles de playback
         self._setup_playback_section(controls)
         
+        # Seção de métricas
+        self._setup_metrics_section(controls)
+        
         # Primeira atualização
         self.update_visualization()
         
@@ -139,6 +143,38 @@ class MainWindow:
             command=self._stop_playback
         ).pack(fill="x", padx=5, pady=2)
         
+    def _setup_metrics_section(self, parent):
+        """Configura a seção de métricas comparativas."""
+        metrics_frame = ttk.LabelFrame(parent, text="Métricas")
+        metrics_frame.pack(fill="x", pady=5)
+        
+        self.metrics_label = ttk.Label(metrics_frame, font="TkFixedFont", justify="left")
+        self.metrics_label.pack(fill="x", padx=5, pady=2)
+        
+    def _update_metrics(self, original, processed):
+        """Atualiza a tabela de métricas do sinal original e processado."""
+        rows = [
+            ('RMS', 'rms', 1, '{:.3f}'),
+            ('Pico', 'peak', 1, '{:.3f}'),
+            ('Crista', 'crest_factor', 1, '{:.2f}'),
+            ('Centróide Hz', 'spectral_centroid', 1, '{:.0f}'),
+            ('Rolloff Hz', 'spectral_rolloff', 1, '{:.0f}'),
+            ('Planicidade', 'spectral_flatness', 1, '{:.3f}'),
+            ('THD %', 'thd', 100, '{:.2f}'),
+        ]
+        
+        def fmt(value, scale, pattern):
+            return '-' if math.isnan(value) else pattern.format(value * scale)
+        
+        lines = [f"{'':<13}{'Orig.':>8}{'Proc.':>8}"]
+        for label, key, scale, pattern in rows:
+            lines.append(
+                f"{label:<13}"
+                f"{fmt(original[key], scale, pattern):>8}"
+                f"{fmt(processed[key], scale, pattern):>8}"
+            )
+        self.metrics_label.config(text="\n".join(lines))
+        
     def _on_frequency_change(self, value):
         """Callback para mudança de frequência."""
         freq = float(value)
@@ -231,15 +267,17 @@ class MainWindow:
     def update_visualization(self):
         """Atualiza a visualização."""
         # Processar áudio
-        self.audio_processor.processed_signal = self.effects_manager.process_audio(
-            self.audio_processor.test_signal,
-            self.audio_processor.sample_rate
-        )
+        self.audio_processor.process(self.effects_manager)
+        
+        # Calcular métricas (a STFT do sinal processado é reaproveitada no espectrograma)
+        original_analysis = self.audio_processor.analyze('original')
+        processed_analysis = self.audio_processor.analyze('processed')
+        self._update_metrics(original_analysis['summary'], processed_analysis['summary'])
         
         # Calcular dados para visualização
         if len(self.audio_processor.test_signal) > 1000:
             spectrum_data = {
-                'spectrogram': self.audio_processor.compute_spectrogram(self.audio_processor.processed_signal)
+                'spectrogram': processed_analysis['spectrogram']
             }
         else:
             spectrum_data = {
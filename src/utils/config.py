@@ -8,6 +8,12 @@ WINDOW_SIZE = "800x600"
 AUDIO_FILETYPES = [("Audio Files", "*.wav *.mp3 *.ogg")]
 DEFAULT_FREQUENCY = 440  # Hz
 
+# Configurações de análise (STFT compartilhada entre espectrograma e métricas)
+SPECTROGRAM_NPERSEG = 1024
+SPECTROGRAM_NOVERLAP = 512
+ROLLOFF_PERCENT = 0.85
+THD_MAX_HARMONIC = 10
+
 # Configurações de visualização
 PLOT_DPI = 100
 PLOT_STYLE = 'dark_background'